@@ -1,14 +1,23 @@
 from __future__ import annotations
 
 import os
+import re
+from collections import defaultdict
+from functools import lru_cache
+from itertools import count
 
-from pydantic import StringConstraints
-from fastapi import FastAPI, HTTPException, Query, status
-from typing import Dict, List, Optional, Annotated
-from datetime import datetime
+import msgspec
+import orjson
 
-from models.course import CourseCreate, CourseRead, CourseUpdate
-from models.professor import ProfessorCreate, ProfessorRead, ProfessorUpdate
+from fastapi import Depends, FastAPI, HTTPException, Query, status
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from models.course import COURSE_EXAMPLE, CourseCreate, CourseRead, CourseUpdate
+from models.professor import PROFESSOR_EXAMPLE, ProfessorCreate, ProfessorRead, ProfessorUpdate
+from models.structs import CourseStruct, InstructorStruct, ProfessorStruct
+from models.types import COURSE_ID_PATTERN, ID_PATTERN, idType, courseIDType, utcnow
 
 port = int(os.environ.get("FASTAPIPORT", 8000))
 
@@ -16,168 +25,298 @@ app = FastAPI(
     title="Professor/Course API",
     description="Demo FastAPI app using Pydantic v2 models for Person and Address",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
-
-idType = Annotated[str, StringConstraints(pattern=r"^[a-z]{2,3}\d{1,4}$")]
-courseIDType = Annotated[str, StringConstraints(pattern=r"^[A-Z]{4}\d{4}$")]
-
-# simple in-memory databases
-professors: Dict[idType, ProfessorRead] = {}
-courses: Dict[courseIDType, CourseRead] = {}
+# list responses repeat field names and instructor objects, so they compress well
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# simple in-memory databases; records are stored as msgspec structs and the
+# Pydantic models are only used to validate input and document responses
+professors: Dict[idType, ProfessorStruct] = {}
+courses: Dict[courseIDType, CourseStruct] = {}
+
+# secondary indexes: lookup key -> set of primary keys in the stores above
+professors_by_first: Dict[str, Set[str]] = defaultdict(set)
+professors_by_last: Dict[str, Set[str]] = defaultdict(set)
+courses_by_instructor: Dict[str, Set[str]] = defaultdict(set)
+# case-folded course names, precomputed on write for the substring filter
+course_names_folded: Dict[str, str] = {}
+# insertion sequence per key, so index hits can be returned in store order
+professor_order: Dict[str, int] = {}
+course_order: Dict[str, int] = {}
+_insert_seq = count()
+
+
+@lru_cache(maxsize=1024)
+def _norm(s: str) -> str:
+    """Case-insensitive lookup key; cached since the same filter values recur."""
+    return s.casefold()
+
+
+def _insert_unique(store: Dict[str, Any], key: str, value: Any, kind: str) -> None:
+    """Insert `value` under `key`, rejecting duplicates with a 400."""
+    if key in store:
+        raise HTTPException(status_code=400, detail=f"{kind} with ID '{key}' already exists.")
+    store[key] = value
+
+
+def _replace_record(store: Dict[str, Any], key: str, new_key: str, value: Any, kind: str,
+                    index: Callable[[str, Any, Any], None]) -> None:
+    """Store an updated record, moving it to `new_key` if the update changed its ID."""
+    if new_key == key:
+        index(key, store[key], value)
+        store[key] = value
+        return
+    _insert_unique(store, new_key, value, kind)
+    index(key, store.pop(key), None)
+    index(new_key, None, value)
+
+
+def _reindex(index: Dict[str, Set[str]], key: str, old: Optional[str], new: Optional[str]) -> None:
+    """Move `key` from the `old` bucket to the `new` bucket of an index."""
+    if old == new:
+        return
+    if old is not None:
+        bucket = index.get(old)
+        if bucket is not None:
+            bucket.discard(key)
+            if not bucket:
+                del index[old]
+    if new is not None:
+        index[new].add(key)
+
+
+def _index_professor(key: str, old: Optional[ProfessorStruct], new: Optional[ProfessorStruct]) -> None:
+    """Keep the professor indexes in sync with a write to `professors[key]`."""
+    if old is None:
+        professor_order[key] = next(_insert_seq)
+    elif new is None:
+        del professor_order[key]
+    _reindex(professors_by_first, key,
+             old.first_name.casefold() if old else None,
+             new.first_name.casefold() if new else None)
+    _reindex(professors_by_last, key,
+             old.last_name.casefold() if old else None,
+             new.last_name.casefold() if new else None)
+
+
+def _index_course(key: str, old: Optional[CourseStruct], new: Optional[CourseStruct]) -> None:
+    """Keep the course indexes in sync with a write to `courses[key]`."""
+    if old is None:
+        course_order[key] = next(_insert_seq)
+    elif new is None:
+        del course_order[key]
+    _reindex(courses_by_instructor, key,
+             old.instructor.id if old and old.instructor else None,
+             new.instructor.id if new and new.instructor else None)
+    if new is None:
+        course_names_folded.pop(key, None)
+    elif old is None or old.courseName != new.courseName:
+        course_names_folded[key] = new.courseName.casefold()
+
+
+_ID_RE = re.compile(ID_PATTERN)
+_COURSE_RE = re.compile(COURSE_ID_PATTERN)
+
+
+async def validate_prof_id(professor_id: str) -> str:
+    """Path-parameter check for professor ids; a single precompiled regex match."""
+    if _ID_RE.fullmatch(professor_id) is None:
+        raise HTTPException(status_code=422, detail=f"Invalid professor ID '{professor_id}'")
+    return professor_id
+
+
+async def validate_course_id(course_id: str) -> str:
+    """Path-parameter check for course ids; a single precompiled regex match."""
+    if _COURSE_RE.fullmatch(course_id) is None:
+        raise HTTPException(status_code=422, detail=f"Invalid course ID '{course_id}'")
+    return course_id
+
+
+def _intersect(candidates: Optional[Set[str]], matches: Set[str]) -> Set[str]:
+    return matches if candidates is None else candidates & matches
 
 
 # -----------------------------------------------------------------------------
 # Professor endpoints
 # -----------------------------------------------------------------------------
-@app.post("/professors", response_model=ProfessorRead, status_code=201, tags=["Professors"])
-def create_professor(professor: ProfessorCreate):
+@app.post("/professors", status_code=201, responses={201: {"model": ProfessorRead}}, tags=["Professors"])
+async def create_professor(professor: ProfessorCreate):
     """
     Create a new professor record.
     The professor's Columbia ID (`id`) is unique.
     """
-    # Check if the Columbia ID already exists to prevent duplicates
-    if any(p.id == professor.id for p in professors.values()):
-        raise HTTPException(
-            status_code=400,
-            detail=f"Professor with Columbia ID '{professor.id}' already exists.",
-        )
-    new_professor = ProfessorRead(**professor.model_dump())
-    professors[new_professor.id] = new_professor
-    return new_professor
-
-
-@app.get("/professors", response_model=List[ProfessorRead], tags=["Professors"])
-def list_professors(
+    new_professor = msgspec.convert(professor.model_dump(), ProfessorStruct)
+    # the Columbia ID is the store key, so uniqueness is a single dict probe
+    _insert_unique(professors, new_professor.id, new_professor, "Professor")
+    _index_professor(new_professor.id, None, new_professor)
+    return ORJSONResponse(content=msgspec.to_builtins(new_professor), status_code=201)
+
+
+@app.get("/professors", responses={200: {"model": List[ProfessorRead]}}, tags=["Professors"])
+async def list_professors(
         first_name: Optional[str] = Query(None, description="Filter by first name"),
         last_name: Optional[str] = Query(None, description="Filter by last name"),
         id: Optional[str] = Query(None, description="Filter by Columbia ID"),
 ):
     """Get a list of all professors, with optional filtering."""
-    results = list(professors.values())
+    candidates: Optional[Set[str]] = None
 
     if first_name:
-        results = [p for p in results if p.first_name.lower() == first_name.lower()]
+        candidates = _intersect(candidates, professors_by_first.get(_norm(first_name), set()))
     if last_name:
-        results = [p for p in results if p.last_name.lower() == last_name.lower()]
+        candidates = _intersect(candidates, professors_by_last.get(_norm(last_name), set()))
     if id:
-        results = [p for p in results if p.id == id]
+        candidates = _intersect(candidates, {id} if id in professors else set())
+
+    if candidates is None:
+        results = list(professors.values())
+    else:
+        results = [professors[k] for k in sorted(candidates, key=professor_order.__getitem__)]
 
-    return results
+    return ORJSONResponse(content=msgspec.to_builtins(results))
 
 
-@app.get("/professors/{professor_id}", response_model=ProfessorRead, tags=["Professors"])
-def get_professor(professor_id: idType):
+@app.get("/professors/{professor_id}", responses={200: {"model": ProfessorRead}}, tags=["Professors"])
+async def get_professor(professor_id: str = Depends(validate_prof_id)):
     """Get a single professor by their id."""
     if professor_id not in professors:
         raise HTTPException(status_code=404, detail="Professor not found")
-    return professors[professor_id]
+    return ORJSONResponse(content=msgspec.to_builtins(professors[professor_id]))
 
 
-@app.patch("/professors/{professor_id}", response_model=ProfessorRead, tags=["Professors"])
-def update_professor(professor_id: idType, update_data: ProfessorUpdate):
+@app.patch("/professors/{professor_id}", responses={200: {"model": ProfessorRead}}, tags=["Professors"])
+async def update_professor(update_data: ProfessorUpdate, professor_id: str = Depends(validate_prof_id)):
     """Partially update a professor's information."""
     if professor_id not in professors:
         raise HTTPException(status_code=404, detail="Professor not found")
 
-    stored_professor_data = professors[professor_id].model_dump()
+    # only the fields the client actually sent; already validated by FastAPI
     update_dict = update_data.model_dump(exclude_unset=True)
-
-    stored_professor_data.update(update_dict)
     # Manually update the `updated_at` timestamp
-    stored_professor_data["updated_at"] = datetime.utcnow()
+    update_dict["updated_at"] = utcnow()
 
-    updated_professor = ProfessorRead(**stored_professor_data)
-    professors[professor_id] = updated_professor
-    return updated_professor
+    updated_professor = msgspec.structs.replace(professors[professor_id], **update_dict)
+    # the store is keyed on the Columbia ID, so an ID change moves the record
+    _replace_record(professors, professor_id, updated_professor.id, updated_professor,
+                    "Professor", _index_professor)
+    return ORJSONResponse(content=msgspec.to_builtins(updated_professor))
 
 
 @app.delete("/professors/{professor_id}", status_code=204, tags=["Professors"])
-def delete_professor(professor_id: idType):
+async def delete_professor(professor_id: str = Depends(validate_prof_id)):
     """Delete a professor."""
-    if professor_id not in professors.keys():
+    if professor_id not in professors:
         raise HTTPException(status_code=404, detail=f"Professor with ID {professor_id} not found")
+    _index_professor(professor_id, professors[professor_id], None)
     del professors[professor_id]
 
 
 # -----------------------------------------------------------------------------
 # Course endpoints
 # -----------------------------------------------------------------------------
-@app.post("/courses", response_model=CourseRead, status_code=201, tags=["Courses"])
-def create_course(course: CourseCreate):
+@app.post("/courses", status_code=201, responses={201: {"model": CourseRead}}, tags=["Courses"])
+async def create_course(course: CourseCreate):
     """
     Create a new course record.
     The course ID (`courseID`) must be unique.
     """
-    if any(c.courseID == course.courseID for c in courses.values()):
-        raise HTTPException(
-            status_code=400,
-            detail=f"Course with ID '{course.courseID}' already exists.",
-        )
-
-    new_course = CourseRead(**course.model_dump())
-    courses[new_course.courseID] = new_course
-    return new_course
+    new_course = msgspec.convert(course.model_dump(), CourseStruct)
+    _insert_unique(courses, new_course.courseID, new_course, "Course")
+    _index_course(new_course.courseID, None, new_course)
+    return ORJSONResponse(content=msgspec.to_builtins(new_course), status_code=201)
 
 
-@app.get("/courses", response_model=List[CourseRead], tags=["Courses"])
-def list_courses(
+@app.get("/courses", responses={200: {"model": List[CourseRead]}}, tags=["Courses"])
+async def list_courses(
         course_id: Optional[courseIDType] = Query(None, description="Filter by course id"),
         course_name: Optional[str] = Query(None, description="Filter by course name"),
         instructor_id: Optional[str] = Query(None, description="Filter by instructor's Columbia ID"),
 ):
     """Get a list of all courses, with optional filtering."""
-    results = list(courses.values())
+    candidates: Optional[Set[str]] = None
 
     if course_id:
-        results = [c for c in results if c.courseID and c.courseID == course_id]
-    if course_name:
-        results = [c for c in results if course_name.lower() in c.courseName.lower()]
+        candidates = _intersect(candidates, {course_id} if course_id in courses else set())
     if instructor_id:
-        results = [c for c in results if c.instructor and c.instructor.id == instructor_id]
+        candidates = _intersect(candidates, courses_by_instructor.get(instructor_id, set()))
+
+    keys = courses.keys() if candidates is None else sorted(candidates, key=course_order.__getitem__)
 
-    return results
+    # substring match cannot be served from an exact-key index, so it only
+    # runs over the candidates left after the indexed filters; with no other
+    # filter it scans the case-folded name column alone, not the records
+    if course_name:
+        course_name_key = _norm(course_name)
+        if candidates is None:
+            keys = [k for k, name in course_names_folded.items() if course_name_key in name]
+        else:
+            keys = [k for k in keys if course_name_key in course_names_folded[k]]
 
+    results = [courses[k] for k in keys]
 
-@app.get("/courses/{course_id}", response_model=CourseRead, tags=["Courses"])
-def get_course(course_id: courseIDType):
+    return ORJSONResponse(content=msgspec.to_builtins(results))
+
+
+@app.get("/courses/{course_id}", responses={200: {"model": CourseRead}}, tags=["Courses"])
+async def get_course(course_id: str = Depends(validate_course_id)):
     """Get a single course by its course_id."""
     if course_id not in courses:
         raise HTTPException(status_code=404, detail="Course not found")
-    return courses[course_id]
+    return ORJSONResponse(content=msgspec.to_builtins(courses[course_id]))
 
 
-@app.patch("/courses/{course_id}", response_model=CourseRead, tags=["Courses"])
-def update_course(course_id: courseIDType, update_data: CourseUpdate):
+@app.patch("/courses/{course_id}", responses={200: {"model": CourseRead}}, tags=["Courses"])
+async def update_course(update_data: CourseUpdate, course_id: str = Depends(validate_course_id)):
     """Partially update a course's information."""
     if course_id not in courses:
         raise HTTPException(status_code=404, detail="Course not found")
 
-    stored_course_data = courses[course_id].model_dump()
+    # only the fields the client actually sent; already validated by FastAPI
     update_dict = update_data.model_dump(exclude_unset=True)
+    if update_dict.get("instructor") is not None:
+        update_dict["instructor"] = msgspec.convert(update_dict["instructor"], InstructorStruct)
+    update_dict["updated_at"] = utcnow()
 
-    stored_course_data.update(update_dict)
-    stored_course_data["updated_at"] = datetime.utcnow()
-
-    updated_course = CourseRead(**stored_course_data)
-    courses[course_id] = updated_course
-    return updated_course
+    updated_course = msgspec.structs.replace(courses[course_id], **update_dict)
+    # the store is keyed on the course ID, so an ID change moves the record
+    _replace_record(courses, course_id, updated_course.courseID, updated_course,
+                    "Course", _index_course)
+    return ORJSONResponse(content=msgspec.to_builtins(updated_course))
 
 
 @app.delete("/courses/{course_id}", status_code=204, tags=["Courses"])
-def delete_course(course_id: courseIDType):
+async def delete_course(course_id: str = Depends(validate_course_id)):
     """Delete a course."""
     if course_id not in courses:
         raise HTTPException(status_code=404, detail=f"Course with ID {course_id} not found")
-    print(len(courses))
+    _index_course(course_id, courses[course_id], None)
     del courses[course_id]
 
 
 # -----------------------------------------------------------------------------
 # Root
 # -----------------------------------------------------------------------------
+# constant payload, serialized once at import time
+_ROOT_BYTES = orjson.dumps({"message": "Welcome to the Professor/Course API. See /docs for OpenAPI UI."})
+
+
 @app.get("/")
-def root():
-    return {"message": "Welcome to the Professor/Course API. See /docs for OpenAPI UI."}
+async def root():
+    return Response(content=_ROOT_BYTES, media_type="application/json")
+
+
+# -----------------------------------------------------------------------------
+# Warm-up: msgspec builds its per-struct codec state lazily, so exercise the
+# storage convert/encode paths once at import instead of on the first request
+# (the Pydantic validators are already built at class definition time)
+# -----------------------------------------------------------------------------
+def _warm_models() -> None:
+    msgspec.to_builtins(msgspec.convert(PROFESSOR_EXAMPLE, ProfessorStruct))
+    msgspec.to_builtins(msgspec.convert(COURSE_EXAMPLE, CourseStruct))
+
+
+_warm_models()
 
 
 # -----------------------------------------------------------------------------
@@ -186,4 +325,12 @@ def root():
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("main:app", host="127.0.0.1", port=port, reload=True)
+    uvicorn.run(
+        "main:app",
+        host="127.0.0.1",
+        port=port,
+        reload=True,
+        loop="uvloop",
+        http="httptools",
+        log_level="warning",
+    )
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from typing import List, Optional
+from datetime import datetime
+
+import msgspec
+
+from .types import utcnow
+
+
+# Storage-side records. Payloads are validated by the Pydantic models at the
+# API boundary; these only hold the already-validated data in memory.
+# Structs are slotted (no per-instance __dict__) and frozen, so updates go
+# through msgspec.structs.replace() rather than mutating a stored record.
+class InstructorStruct(msgspec.Struct, frozen=True):
+    first_name: str
+    last_name: str
+    id: str
+    email: str
+    courses: List[str] = []
+
+
+class ProfessorStruct(msgspec.Struct, frozen=True):
+    first_name: str
+    last_name: str
+    id: str
+    email: str
+    courses: List[str] = []
+    created_at: datetime = msgspec.field(default_factory=utcnow)
+    updated_at: datetime = msgspec.field(default_factory=utcnow)
+
+
+class CourseStruct(msgspec.Struct, frozen=True):
+    courseID: str
+    courseName: str
+    instructor: Optional[InstructorStruct]
+    assignment: Optional[List[str]] = None
+    created_at: datetime = msgspec.field(default_factory=utcnow)
+    updated_at: datetime = msgspec.field(default_factory=utcnow)
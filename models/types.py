@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from typing import Annotated
+from datetime import datetime, timezone
+from functools import partial
+from pydantic import StringConstraints
+
+ID_PATTERN = r"^[a-z]{2,3}\d{1,4}$"
+COURSE_ID_PATTERN = r"^[A-Z]{4}\d{4}$"
+
+# Shared constrained-string aliases; define once so every model reuses the same validator.
+idType = Annotated[str, StringConstraints(pattern=ID_PATTERN)]
+courseIDType = Annotated[str, StringConstraints(pattern=COURSE_ID_PATTERN)]
+
+
+def omit_default(schema: dict) -> None:
+    """json_schema_extra hook for omit-only PATCH fields: hide their `null` default."""
+    schema.pop("default", None)
+
+
+# Timezone-aware UTC timestamp factory shared by the models and storage structs.
+utcnow = partial(datetime.now, timezone.utc)